@@ -20,12 +20,15 @@
 # - Loop errors print to terminal
 
 import json
+import os
+import queue
 import sys
 import time
 import threading
 import traceback
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional, Dict, Tuple
 
 import numpy as np
@@ -36,6 +39,21 @@ from tkinter import font as tkfont
 from PIL import Image, ImageTk
 import cv2
 
+try:
+    import dxcam  # optional: Windows Desktop Duplication capture
+except Exception:
+    dxcam = None
+
+try:
+    import orjson  # optional: faster config serialisation
+except Exception:
+    orjson = None
+
+try:
+    import winsound  # Windows only
+except Exception:
+    winsound = None
+
 APP_NAME = "SusAlert Lite"
 
 if getattr(sys, "frozen", False) and hasattr(sys, "executable"):
@@ -59,6 +77,9 @@ ROTATION_EVENTS = [
     (133, "Stun"),
     (145, "MID!"),
 ]
+ROTATION_SECS = np.array([e[0] for e in ROTATION_EVENTS], dtype=np.int32)
+ROTATION_NAMES = tuple(e[1] for e in ROTATION_EVENTS)
+ROTATION_NOW_TEXTS = tuple(f"{name} NOW!" for name in ROTATION_NAMES)
 ENERGY_TIME = 145
 
 
@@ -74,10 +95,11 @@ def default_cfg() -> dict:
     return {
         "always_on_top": True,
         "poll_ms": 120,
+        "near_event_poll_ms": 60,    # within a few seconds of a mechanic / countdown trigger
         "template_threshold": 0.62,
+        "use_opencl": False,         # opt-in: OpenCL (cv2.UMat) template matching
         "timer_region": None,
         "timer_template_path": "assets/timer_template.png",
-        "cooldown_s": 1.0,
         "setup_complete": False,
         "first_run_popup_shown": False,
 
@@ -136,12 +158,51 @@ def load_cfg() -> dict:
     return default_cfg()
 
 
+def _dumps_cfg(cfg: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+    return json.dumps(cfg, indent=2).encode("utf-8")
+
+
 def save_cfg(cfg: dict) -> None:
     try:
         CFG_PATH.parent.mkdir(parents=True, exist_ok=True)
     except Exception:
         pass
-    CFG_PATH.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    # write + rename, so a crash mid-write never leaves a truncated config.json
+    tmp = CFG_PATH.with_suffix(".json.tmp")
+    tmp.write_bytes(_dumps_cfg(cfg))
+    os.replace(tmp, CFG_PATH)
+
+
+# first sound method that worked; later alerts call it directly
+_sound_fn = None
+
+
+def _bell(root: Optional[tk.Tk]) -> None:
+    if root is not None:
+        root.bell()
+
+
+def _sound_candidates():
+    if winsound is None:
+        return (_bell,)
+
+    def play_alias(_root):
+        winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS | winsound.SND_ASYNC)
+
+    def message_beep(_root):
+        winsound.MessageBeep(winsound.MB_ICONASTERISK)
+
+    def beep(_root):
+        winsound.Beep(880, 120)
+        winsound.Beep(660, 120)
+
+    return (play_alias, message_beep, beep, _bell)
+
+
+# built once at import so the first alert doesn't pay for it
+_SOUND_CANDIDATES = _sound_candidates()
 
 
 def play_alert_sound(root: Optional[tk.Tk] = None) -> None:
@@ -149,37 +210,24 @@ def play_alert_sound(root: Optional[tk.Tk] = None) -> None:
     Windows-friendly sound that should work on essentially all PCs.
     Fallback chain:
       PlaySound(system alias) -> MessageBeep -> Beep -> Tk bell
+    The chain is only walked until something works; that method is then
+    reused for every later alert (and re-probed if it ever fails).
     """
-    try:
-        import winsound
-
+    global _sound_fn
+    if _sound_fn is not None:
         try:
-            winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS | winsound.SND_ASYNC)
+            _sound_fn(root)
             return
         except Exception:
-            pass
+            _sound_fn = None
 
+    for fn in _SOUND_CANDIDATES:
         try:
-            winsound.MessageBeep(winsound.MB_ICONASTERISK)
-            return
+            fn(root)
         except Exception:
-            pass
-
-        try:
-            winsound.Beep(880, 120)
-            winsound.Beep(660, 120)
-            return
-        except Exception:
-            pass
-
-    except Exception:
-        pass
-
-    try:
-        if root is not None:
-            root.bell()
-    except Exception:
-        pass
+            continue
+        _sound_fn = fn
+        return
 
 
 class AnnouncementOverlay:
@@ -205,11 +253,17 @@ class AnnouncementOverlay:
         except Exception:
             pass
 
+        self._refresh_cfg_cache()
+
+        # one Tcl font per (family, size); rebuilt only when settings change it
+        self._font_cache: Dict[Tuple[str, int], tkfont.Font] = {}
+        self._cached_font = self._font()
+
         self.label = tk.Label(
             self.win, text="",
             bg=self.TRANSPARENT_KEY,
             fg=self.cfg.get("theme_fg", "#ffffff"),
-            font=self._font(),
+            font=self._cached_font,
             padx=12, pady=8
         )
         self.label.pack()
@@ -219,21 +273,63 @@ class AnnouncementOverlay:
         self._dx = 0
         self._dy = 0
 
+        # screen size is cached; refreshed when the main window is reconfigured
+        self._sw = self.win.winfo_screenwidth()
+        self._sh = self.win.winfo_screenheight()
+        self._last_geom: Optional[Tuple[int, int, int, int]] = None
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
+
         self._apply_position()
 
+    def _refresh_cfg_cache(self):
+        """Typed copies of the msbt_* settings, so timer callbacks skip dict lookups + coercion."""
+        self._msbt_enabled = bool(self.cfg.get("msbt_enabled", True))
+        self._anchor = str(self.cfg.get("msbt_anchor", "custom"))
+        self._x = int(self.cfg.get("msbt_x", 400))
+        self._y = int(self.cfg.get("msbt_y", 120))
+        self._step_ms = int(self.cfg.get("msbt_step_ms", 250))
+        self._dur_ms = int(self.cfg.get("msbt_duration_ms", 2500))
+        self._font_family = str(self.cfg.get("msbt_font_family", "Segoe UI"))
+        self._font_size = int(self.cfg.get("msbt_font_size", 30))
+
     def _font(self):
-        fam = str(self.cfg.get("msbt_font_family", "Segoe UI"))
-        size = int(self.cfg.get("msbt_font_size", 30))
-        return tkfont.Font(family=fam, size=size, weight="bold")
+        fam = self._font_family
+        size = self._font_size
+        f = self._font_cache.get((fam, size))
+        if f is None:
+            f = tkfont.Font(family=fam, size=size, weight="bold")
+            self._font_cache[(fam, size)] = f
+        return f
+
+    def _on_cfg_changed(self):
+        placement = (self._anchor, self._x, self._y)
+        self._refresh_cfg_cache()
+        f = self._font()
+        if f is not self._cached_font:
+            self._cached_font = f
+            self.label.config(font=f)
+        elif placement == (self._anchor, self._x, self._y):
+            return  # nothing that moves or resizes the overlay changed
+        self._apply_position()
 
-    def _apply_position(self):
-        self.win.update_idletasks()
-        w = self.win.winfo_reqwidth()
-        h = self.win.winfo_reqheight()
+    def _on_root_configure(self, e):
+        if e.widget is not self.root:
+            return
         sw = self.win.winfo_screenwidth()
         sh = self.win.winfo_screenheight()
+        if (sw, sh) != (self._sw, self._sh):
+            self._sw, self._sh = sw, sh
+            self._last_geom = None
 
-        anchor = str(self.cfg.get("msbt_anchor", "custom"))
+    def _apply_position(self):
+        # the label's requested size is updated as soon as its text/font is
+        # configured, so no update_idletasks round-trip is needed here
+        w = self.label.winfo_reqwidth()
+        h = self.label.winfo_reqheight()
+        sw = self._sw
+        sh = self._sh
+
+        anchor = self._anchor
         if anchor == "top_left":
             x, y = 0, 0
         elif anchor == "top":
@@ -252,11 +348,15 @@ class AnnouncementOverlay:
         elif anchor == "bottom_right":
             x, y = sw - w, sh - h
         else:
-            x = int(self.cfg.get("msbt_x", 400))
-            y = int(self.cfg.get("msbt_y", 120))
+            x = self._x
+            y = self._y
 
         x = max(0, min(sw - w, x))
         y = max(0, min(sh - h, y))
+        geom = (x, y, w, h)
+        if geom == self._last_geom:
+            return
+        self._last_geom = geom
         self.win.geometry(f"+{x}+{y}")
 
     def hide(self):
@@ -270,29 +370,31 @@ class AnnouncementOverlay:
 
     def show_text(self, text: str, hold_ms: int):
         self.hide()
-        self.label.config(text=text, font=self._font())
+        self.label.config(text=text, font=self._cached_font)
         self._apply_position()
         self.win.deiconify()
         self._job = self.root.after(max(250, int(hold_ms)), self.hide)
 
     def show_countdown(self, label: str, seconds: int):
         self.hide()
-        step_ms = int(self.cfg.get("msbt_step_ms", 250))
-        dur_ms = int(self.cfg.get("msbt_duration_ms", 2500))
+        step_ms = self._step_ms
+        dur_ms = self._dur_ms
+        tmpl = label + " in %d…"
+        now_text = label + " NOW!"
 
         def step(s: int):
-            if not bool(self.cfg.get("msbt_enabled", True)):
+            if not self._msbt_enabled:
                 self.hide()
                 return
             if s > 0:
-                self.label.config(text=f"{label} in {s}…", font=self._font())
+                self.label.config(text=tmpl % s, font=self._cached_font)
                 self._apply_position()
                 self.win.deiconify()
                 self._job = self.root.after(1000, lambda: step(s - 1))
             else:
-                self.show_text(f"{label} NOW!", dur_ms)
+                self.show_text(now_text, dur_ms)
 
-        self.label.config(text=f"{label} in {seconds}…", font=self._font())
+        self.label.config(text=tmpl % seconds, font=self._cached_font)
         self._apply_position()
         self.win.deiconify()
         self._job = self.root.after(max(50, step_ms), lambda: step(int(seconds)))
@@ -301,7 +403,7 @@ class AnnouncementOverlay:
         if self._drag_mode:
             return
         self._drag_mode = True
-        self.label.config(text="Drag me (MSBT position)\nClick to save", font=self._font())
+        self.label.config(text="Drag me (MSBT position)\nClick to save", font=self._cached_font)
         self._apply_position()
         self.win.deiconify()
 
@@ -313,6 +415,7 @@ class AnnouncementOverlay:
             x = self.win.winfo_pointerx() - self._dx
             y = self.win.winfo_pointery() - self._dy
             self.win.geometry(f"+{x}+{y}")
+            self._last_geom = None
 
         def up(_e):
             sw = self.win.winfo_screenwidth()
@@ -322,6 +425,7 @@ class AnnouncementOverlay:
             self.cfg["msbt_anchor"] = "custom"
             self.cfg["msbt_x"] = x
             self.cfg["msbt_y"] = y
+            self._refresh_cfg_cache()
             if self.on_cfg_changed:
                 self.on_cfg_changed(self.cfg)
             self._drag_mode = False
@@ -412,25 +516,90 @@ class RegionSelector(tk.Toplevel):
 
 class TimerMatcher:
     """Template match: determines whether the boss timer widget is present in the selected region."""
-    def __init__(self, template_path: Path, threshold: float):
+    # Region + template are shrunk to about this many pixels before scoring,
+    # so matching cost doesn't grow with the size of the selected region.
+    MATCH_PIXELS = 2000
+
+    def __init__(self, template_path: Path, threshold: float, use_opencl: bool = False):
         self.template_path = template_path
         self.threshold = threshold
         self.template = None
+        self._use_ocl = False
+        if use_opencl:
+            try:
+                if cv2.ocl.haveOpenCL():
+                    cv2.ocl.setUseOpenCL(True)
+                    self._use_ocl = bool(cv2.ocl.useOpenCL())
+            except Exception:
+                self._use_ocl = False
+        self._tpl_umat = None
+        self._scale = 1.0
+        self._tpl_small: Optional[np.ndarray] = None
+        self._gray_small: Optional[np.ndarray] = None
+        # template and region are the same size, so the match result is always 1x1
+        self._match_result = np.empty((1, 1), np.float32)
         if template_path.exists():
             self.template = cv2.imread(str(template_path), cv2.IMREAD_GRAYSCALE)
+            self._prepare_template()
+
+    def _prepare_template(self):
+        """Downscaled copy of the template (and its UMat when OpenCL is on), computed once."""
+        if self.template is None:
+            self._tpl_small = None
+            self._gray_small = None
+            self._tpl_umat = None
+            return
+        self._scale = min(1.0, float(np.sqrt(self.MATCH_PIXELS / float(self.template.size))))
+        if self._scale < 1.0:
+            # explicit dsize (not fx/fy) so score() resizes grabs with identical weights
+            th, tw = self.template.shape[:2]
+            dsize = (max(1, int(round(tw * self._scale))), max(1, int(round(th * self._scale))))
+            self._tpl_small = cv2.resize(self.template, dsize, interpolation=cv2.INTER_AREA)
+            self._gray_small = np.empty_like(self._tpl_small)
+        else:
+            self._tpl_small = self.template
+            self._gray_small = None
+        self._tpl_umat = None
+        if self._use_ocl:
+            try:
+                self._tpl_umat = cv2.UMat(self._tpl_small)
+            except Exception:
+                self._use_ocl = False
 
     def save_template(self, gray: np.ndarray):
         self.template_path.parent.mkdir(parents=True, exist_ok=True)
         cv2.imwrite(str(self.template_path), gray)
-        self.template = gray
+        # copy: the capture buffers are reused on the next grab
+        self.template = gray.copy()
+        self._prepare_template()
 
     def score(self, gray: np.ndarray) -> float:
-        if self.template is None:
+        """
+        TM_CCOEFF_NORMED of the region against the template. Both stay uint8
+        so OpenCV uses its integer SIMD path. A yes/no presence check doesn't
+        need full resolution, so both sides are compared at the reduced size
+        from _prepare_template.
+        """
+        if self.template is None or self._tpl_small is None:
             return 0.0
         if gray.shape != self.template.shape:
             return 0.0
-        res = cv2.matchTemplate(gray, self.template, cv2.TM_CCOEFF_NORMED)
-        return float(res.max())
+        if self._gray_small is not None:
+            cv2.resize(
+                gray, dsize=self._tpl_small.shape[::-1], dst=self._gray_small,
+                interpolation=cv2.INTER_AREA,
+            )
+            gray = self._gray_small
+        if self._tpl_umat is not None:
+            try:
+                res = cv2.matchTemplate(cv2.UMat(gray), self._tpl_umat, cv2.TM_CCOEFF_NORMED)
+                return float(res.get()[0, 0])
+            except Exception:
+                # broken OpenCL driver: stay on the CPU path from now on
+                self._use_ocl = False
+                self._tpl_umat = None
+        res = cv2.matchTemplate(gray, self._tpl_small, cv2.TM_CCOEFF_NORMED, result=self._match_result)
+        return float(res[0, 0])
 
     def is_present(self, gray: np.ndarray) -> bool:
         return self.score(gray) >= self.threshold
@@ -450,7 +619,8 @@ class App(tk.Tk):
         self.configure(bg=self.bg)
         self.resizable(False, False)
         self.overrideredirect(True)
-        self.attributes("-topmost", bool(self.cfg.get("always_on_top", True)))
+        self._last_topmost = bool(self.cfg.get("always_on_top", True))
+        self.attributes("-topmost", self._last_topmost)
 
         # window pos: saved, else top-left
         x = self.cfg.get("window_x")
@@ -461,6 +631,8 @@ class App(tk.Tk):
             self.geometry("315x132+0+0")       # +15px width
 
         self._base_h = 132
+        self._last_h: Optional[int] = None
+        self._last_geom: Optional[Tuple[int, int]] = None
 
         # hotkeys (in-app)
         self.bind_all("<Escape>", lambda e: self._safe_close())
@@ -474,23 +646,56 @@ class App(tk.Tk):
         # state
         self.running = False
         self.worker: Optional[threading.Thread] = None
+        self._stop_evt = threading.Event()
+        # cuts the worker's sleep short (stop, settings change)
+        self._wake_evt = threading.Event()
+        # poll interval the scoring loop wants; the grab pump paces itself by it
+        self._poll_delay_s = 0.12
+        # loop-error dedup: signature of the last traceback printed + repeats since
+        # kept per thread ("loop" / "capture") so the two don't reset each other
+        self._last_exc_sig: Dict[str, Optional[Tuple[str, str]]] = {}
+        self._exc_count: Dict[str, int] = {}
+
+        # capture: guards timer_region swaps + the shared capture buffers
+        self._capture_lock = threading.Lock()
+        # MSS handles are thread-bound, so each capturing thread keeps its own context
+        self._tls = threading.local()
+        # per-region capture state, (re)built by _set_timer_region
+        self.timer_region: Optional[Region] = None
+        self._mon_dict: Optional[dict] = None
+        self._last_gray: Optional[np.ndarray] = None
+        self._gray_buf: Optional[np.ndarray] = None
+        self._set_timer_region(self._cfg_region())
+        self._dxcam = None
+        if dxcam is not None:
+            try:
+                self._dxcam = dxcam.create(output_idx=0, output_color="BGR")
+            except Exception:
+                self._dxcam = None
 
-        self.timer_region = self._cfg_region()
         self.matcher = TimerMatcher(
             BASE / self.cfg.get("timer_template_path", "assets/timer_template.png"),
             float(self.cfg.get("template_threshold", 0.62)),
+            use_opencl=bool(self.cfg.get("use_opencl", False)),
         )
 
         self.encounter_active = False
         self.rotation_start = 0.0
+        # monotonic time each event is due, from rotation_start + offset,
+        # and which of them have already fired this rotation
+        self._event_firetimes = ROTATION_SECS.astype(np.float64)
+        self._fired = np.zeros(len(ROTATION_SECS), dtype=bool)
+        self._cd_fired = np.zeros(len(ROTATION_SECS), dtype=bool)
         self.last_seen_timer = 0.0
-        self.last_event_fire: Dict[str, float] = {}
-        self.last_banner_fire: Dict[str, float] = {}
         self.energy_button_shown = False
 
         # demo
         self.demo_running = False
 
+        # deferred config save (offset clicks)
+        self._cfg_dirty = False
+        self._cfg_flush_job = None
+
         # time adjustment
         self.time_offset_ms = int(self.cfg.get("time_offset_ms", 0))
         self.time_offset_var = tk.StringVar(value=self._fmt_offset(self.time_offset_ms))
@@ -499,6 +704,13 @@ class App(tk.Tk):
         self.status = tk.StringVar(value="WAITING — encounter start")
         self.next_name = tk.StringVar(value="Next: Red Spore")
         self.countdown = tk.StringVar(value="00:13")
+        self._fmt_last_r = -1
+        self._fmt_last_s = ""
+        # last value the worker sent to each of the vars above
+        self._last_pushed: Dict[str, str] = {}
+        # changed values waiting for the next _flush_ui on the Tk thread
+        self._pending_ui: Dict[str, str] = {}
+        self._ui_lock = threading.Lock()
 
         # help window handle
         self._help_win: Optional[tk.Toplevel] = None
@@ -506,6 +718,15 @@ class App(tk.Tk):
         # banner job refs
         self._banner_hide_job = None
         self._banner_seq_job = None
+        self._banner_cd_tmpl = ""
+        self._banner_cd_now = ""
+        self._banner_cd_remaining = 0
+
+        # typed settings snapshot read by the worker + banner code; rebuilt by _apply_settings
+        self._rebuild_cfg_snap()
+        self._apply_pending_job = None
+        # cfg as of the last settings apply; lets _apply_settings_now skip no-op changes
+        self._applied_cfg = dict(self.cfg)
 
         # announcement overlay
         self.msbt = AnnouncementOverlay(self, self.cfg, on_cfg_changed=self._on_cfg_changed)
@@ -648,19 +869,58 @@ class App(tk.Tk):
     def _on_cfg_changed(self, cfg: dict):
         save_cfg(cfg)
 
-    @staticmethod
-    def _fmt_mmss(seconds: int) -> str:
-        seconds = max(0, int(seconds))
-        m = seconds // 60
-        s = seconds % 60
-        return f"{m:02d}:{s:02d}"
+    def _rebuild_cfg_snap(self):
+        """
+        Coerce the settings used on every tick once. The snapshot is swapped
+        in as a whole, so the worker always sees a consistent set.
+        """
+        poll_s = float(self.cfg.get("poll_ms", 120)) / 1000.0
+        demo_mode = bool(self.cfg.get("demo_mode", False))
+        self._cfg_snap = SimpleNamespace(
+            demo_mode=demo_mode,
+            status_running="RUNNING (DEMO)" if demo_mode else "RUNNING",
+            status_waiting="WAITING (DEMO) — press Start Demo" if demo_mode else "WAITING — encounter start",
+            event_sound=bool(self.cfg.get("event_sound", True)),
+            banner_enabled=bool(self.cfg.get("banner_enabled", False)),
+            banner_mode=str(self.cfg.get("banner_mode", "COUNTDOWN")),
+            banner_cd_s=int(self.cfg.get("banner_countdown_s", 3)),
+            banner_hold_ms=int(self.cfg.get("banner_hold_ms", 1200)),
+            msbt_enabled=bool(self.cfg.get("msbt_enabled", True)),
+            msbt_duration_ms=int(self.cfg.get("msbt_duration_ms", 2500)),
+            poll_s=poll_s,
+            near_s=min(poll_s, float(self.cfg.get("near_event_poll_ms", 60)) / 1000.0),
+        )
+
+    def _schedule_cfg_save(self, delay_ms: int = 200):
+        """Coalesce rapid changes (e.g. repeated offset clicks) into one write."""
+        self._cfg_dirty = True
+        if self._cfg_flush_job is None:
+            self._cfg_flush_job = self.after(delay_ms, self._flush_cfg)
+
+    def _flush_cfg(self):
+        self._cfg_flush_job = None
+        if not self._cfg_dirty:
+            return
+        self._cfg_dirty = False
+        try:
+            save_cfg(self.cfg)
+        except Exception:
+            pass
+
+    def _fmt_mmss(self, seconds: int) -> str:
+        # the countdown only changes once a second but is formatted every tick
+        if seconds == self._fmt_last_r:
+            return self._fmt_last_s
+        m, s = divmod(max(0, int(seconds)), 60)
+        self._fmt_last_r = seconds
+        self._fmt_last_s = f"{m:02d}:{s:02d}"
+        return self._fmt_last_s
 
     @staticmethod
-    def _next_event(rot_t: float) -> Tuple[int, str]:
-        for sec, name in ROTATION_EVENTS:
-            if rot_t < sec:
-                return sec, name
-        return ROTATION_EVENTS[-1]
+    def _next_event(rot_t: float) -> int:
+        """Index into ROTATION_SECS/ROTATION_NAMES of the next event (the last one once past it)."""
+        i = int(np.searchsorted(ROTATION_SECS, rot_t, side="right"))
+        return min(i, len(ROTATION_SECS) - 1)
 
     @staticmethod
     def _fmt_offset(ms: int) -> str:
@@ -672,8 +932,10 @@ class App(tk.Tk):
         new_ms = int(max(-5000, min(5000, new_ms)))
         self.time_offset_ms = new_ms
         self.cfg["time_offset_ms"] = new_ms
-        save_cfg(self.cfg)
+        self._schedule_cfg_save()
         self.time_offset_var.set(self._fmt_offset(new_ms))
+        # the loop fires anything this made due; long-overdue events are skipped there
+        self._update_event_firetimes()
 
     def _offset_minus(self):
         self._set_offset_ms(self.time_offset_ms - 100)
@@ -681,25 +943,43 @@ class App(tk.Tk):
     def _offset_plus(self):
         self._set_offset_ms(self.time_offset_ms + 100)
 
+    def _start_rotation(self, t: float):
+        self.rotation_start = t
+        self._update_event_firetimes()
+        self._fired = np.zeros(len(ROTATION_SECS), dtype=bool)
+        self._cd_fired = np.zeros(len(ROTATION_SECS), dtype=bool)
+
+    def _update_event_firetimes(self):
+        self._event_firetimes = self.rotation_start + ROTATION_SECS - (self.time_offset_ms / 1000.0)
+
     def _effective_elapsed(self) -> float:
-        return (time.time() - self.rotation_start) + (self.time_offset_ms / 1000.0)
+        return (time.monotonic() - self.rotation_start) + (self.time_offset_ms / 1000.0)
 
     # -------------------- sizing --------------------
 
     def _resize_dynamic(self, allow_shrink: bool = True):
         try:
+            # reqheight of the toplevel only reflects pack changes after idle tasks run
             self.update_idletasks()
-            w = self.winfo_width()
-            x = self.winfo_x()
-            y = self.winfo_y()
-
-            req_h = self.winfo_reqheight()
-            target_h = max(self._base_h, req_h)
+            geom = (self.winfo_reqwidth(), self.winfo_reqheight())
+            # _last_geom: requested size the window was last fitted to exactly (shrink allowed)
+            if allow_shrink and geom == self._last_geom:
+                return
+            target_h = max(self._base_h, geom[1])
 
             if not allow_shrink:
+                if self._last_h is not None and target_h <= self._last_h:
+                    return
                 target_h = max(target_h, self.winfo_height())
 
-            self.geometry(f"{w}x{target_h}+{x}+{y}")
+            # skip the geometry() call (and the resize cascade it triggers) if nothing changed
+            if target_h != self._last_h:
+                w = self.winfo_width()
+                x = self.winfo_x()
+                y = self.winfo_y()
+                self.geometry(f"{w}x{target_h}+{x}+{y}")
+                self._last_h = target_h
+            self._last_geom = geom if allow_shrink else None
         except Exception:
             pass
 
@@ -726,7 +1006,13 @@ class App(tk.Tk):
     # -------------------- close & persistence --------------------
 
     def _safe_close(self):
-        self.running = False
+        if self._apply_pending_job is not None:
+            try:
+                self.after_cancel(self._apply_pending_job)
+                self._apply_settings_now()
+            except Exception:
+                pass
+        self._stop_monitoring()
         self.demo_running = False
         self._save_position()
 
@@ -741,9 +1027,27 @@ class App(tk.Tk):
         except Exception:
             pass
 
+        self._close_mss()
+
+        # the grab pump may still be mid-grab: detach the handle under its lock first
+        with self._capture_lock:
+            cam, self._dxcam = self._dxcam, None
+        try:
+            if cam is not None:
+                cam.release()
+        except Exception:
+            pass
+
         self.destroy()
 
     def _save_position(self):
+        if self._cfg_flush_job is not None:
+            try:
+                self.after_cancel(self._cfg_flush_job)
+            except Exception:
+                pass
+            self._cfg_flush_job = None
+        self._cfg_dirty = False
         try:
             self.cfg["window_x"] = int(self.winfo_x())
             self.cfg["window_y"] = int(self.winfo_y())
@@ -786,7 +1090,9 @@ class App(tk.Tk):
         with mss.mss() as sct:
             mon = sct.monitors[1]
             grabbed = sct.grab(mon)
-            img = Image.frombytes("RGB", grabbed.size, grabbed.rgb)
+            # cvtColor instead of grabbed.rgb: MSS builds .rgb with a slow bytes swizzle
+            rgb = cv2.cvtColor(np.asarray(grabbed), cv2.COLOR_BGRA2RGB)
+        img = Image.fromarray(rgb)
 
         def done(sel):
             if not sel:
@@ -796,7 +1102,7 @@ class App(tk.Tk):
                 return
 
             x, y, w, h = sel
-            self.timer_region = Region(x, y, w, h)
+            self._set_timer_region(Region(x, y, w, h))
             self.cfg["timer_region"] = {"x": x, "y": y, "w": w, "h": h}
             save_cfg(self.cfg)
 
@@ -820,11 +1126,9 @@ class App(tk.Tk):
         RegionSelector(self, img, done, bg=self.bg)
 
     def reset_setup(self):
-        self.running = False
+        self._stop_monitoring()
         self.demo_running = False
         self.encounter_active = False
-        self.last_event_fire.clear()
-        self.last_banner_fire.clear()
         self.energy_button_shown = False
         self._hide_energy_button()
 
@@ -839,21 +1143,76 @@ class App(tk.Tk):
         except Exception:
             pass
 
-        self.timer_region = None
+        self._set_timer_region(None)
         self.matcher.template = None
         self.after(50, self.first_time_setup)
 
     # -------------------- capture --------------------
 
+    def _mss(self):
+        sct = getattr(self._tls, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._tls.sct = sct
+        return sct
+
+    def _close_mss(self):
+        sct = getattr(self._tls, "sct", None)
+        self._tls.sct = None
+        if sct is not None:
+            try:
+                sct.close()
+            except Exception:
+                pass
+
+    def _set_timer_region(self, r: Optional[Region]):
+        """Swap the capture region and size the grab buffers for it up front."""
+        with self._capture_lock:
+            self.timer_region = r
+            self._last_gray = None
+            if r is None:
+                self._mon_dict = None
+                self._gray_buf = None
+                return
+            self._mon_dict = {"left": r.x, "top": r.y, "width": r.w, "height": r.h}
+            self._gray_buf = np.empty((r.h, r.w), np.uint8)
+
     def _grab_gray(self) -> Optional[np.ndarray]:
+        with self._capture_lock:
+            return self._grab_gray_locked()
+
+    def _grab_gray_locked(self) -> Optional[np.ndarray]:
         r = self.timer_region
         if not r:
             return None
-        with mss.mss() as sct:
-            img = sct.grab({"left": r.x, "top": r.y, "width": r.w, "height": r.h})
-            frame = np.array(img)[:, :, :3]
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        return cv2.normalize(gray, None, 0, 255, cv2.NORM_MINMAX)
+
+        frame = None
+        if self._dxcam is not None:
+            try:
+                frame = self._dxcam.grab(region=(r.x, r.y, r.x + r.w, r.y + r.h))
+            except Exception:
+                # e.g. region off the primary output: use MSS from now on
+                cam, self._dxcam = self._dxcam, None
+                try:
+                    cam.release()
+                except Exception:
+                    pass
+            else:
+                # DXcam returns None when the screen hasn't changed since the last grab
+                if frame is None and self._last_gray is not None:
+                    return self._last_gray
+
+        # No min/max normalize here: TimerMatcher.score is a correlation
+        # coefficient, which is already invariant to brightness/contrast
+        # changes. Templates are stored as raw gray for the same reason.
+        if frame is not None:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+        else:
+            img = self._mss().grab(self._mon_dict)
+            # (h, w, 4) BGRA view of MSS's buffer, valid until the next grab
+            cv2.cvtColor(np.asarray(img), cv2.COLOR_BGRA2GRAY, dst=self._gray_buf)
+        self._last_gray = self._gray_buf
+        return self._last_gray
 
     # -------------------- energy fungi button --------------------
 
@@ -868,7 +1227,7 @@ class App(tk.Tk):
         self._resize_dynamic(allow_shrink=True)
 
     def resume_rotation(self):
-        self.rotation_start = time.time()
+        self._start_rotation(time.monotonic())
         self.energy_button_shown = False
         self._hide_energy_button()
         if bool(self.cfg.get("event_sound", True)):
@@ -901,7 +1260,7 @@ class App(tk.Tk):
 
     def _banner_countdown(self, label: str, seconds: int):
         if seconds <= 0:
-            self._show_banner_text(f"{label} NOW!", int(self.cfg.get("banner_hold_ms", 1200)))
+            self._show_banner_text(f"{label} NOW!", self._cfg_snap.banner_hold_ms)
             return
 
         if self._banner_seq_job:
@@ -917,19 +1276,28 @@ class App(tk.Tk):
                 pass
             self._banner_hide_job = None
 
-        def step(s: int):
-            if not bool(self.cfg.get("banner_enabled", False)):
-                self._banner_hide_now()
-                return
-            if s > 0:
-                self.banner_label.config(text=f"{label} in {s}…")
-                self.banner_label.place(relx=0.5, rely=0.55, anchor="center")
-                self.banner_label.lift()
-                self._banner_seq_job = self.after(1000, lambda: step(s - 1))
-            else:
-                self._show_banner_text(f"{label} NOW!", int(self.cfg.get("banner_hold_ms", 1200)))
+        # per-countdown text, formatted with % on each tick
+        self._banner_cd_tmpl = label + " in %d…"
+        self._banner_cd_now = label + " NOW!"
+        self._banner_cd_remaining = int(seconds)
+        self.banner_label.config(text=self._banner_cd_tmpl % self._banner_cd_remaining)
+        self.banner_label.place(relx=0.5, rely=0.55, anchor="center")
+        self.banner_label.lift()
+        self._banner_seq_job = self.after(1000, self._banner_cd_tick)
 
-        step(int(seconds))
+    def _banner_cd_tick(self):
+        self._banner_seq_job = None
+        if not self._cfg_snap.banner_enabled:
+            self._banner_hide_now()
+            return
+        self._banner_cd_remaining -= 1
+        r = self._banner_cd_remaining
+        if r > 0:
+            # label is already placed and lifted; only the text changes per tick
+            self.banner_label.config(text=self._banner_cd_tmpl % r)
+            self._banner_seq_job = self.after(1000, self._banner_cd_tick)
+        else:
+            self._show_banner_text(self._banner_cd_now, self._cfg_snap.banner_hold_ms)
 
     # -------------------- settings panel --------------------
 
@@ -940,12 +1308,23 @@ class App(tk.Tk):
             self.cfg["settings_open"] = False
             save_cfg(self.cfg)
         else:
+            if not self._settings_built:
+                self._build_settings_panel()
             self.settings_frame.pack(fill="x", padx=10, pady=(4, 6), after=self.header)
             self._resize_dynamic(allow_shrink=True)
             self.cfg["settings_open"] = True
             save_cfg(self.cfg)
 
     def _apply_settings(self):
+        """Debounced: spinbox typing / quick clicks collapse into one apply."""
+        if self._apply_pending_job is not None:
+            try:
+                self.after_cancel(self._apply_pending_job)
+            except Exception:
+                pass
+        self._apply_pending_job = self.after(300, self._apply_settings_now)
+
+    def _read_settings_vars(self):
         self.cfg["always_on_top"] = bool(self.var_topmost.get())
         self.cfg["event_sound"] = bool(self.var_sound.get())
 
@@ -977,20 +1356,34 @@ class App(tk.Tk):
         except Exception:
             self.cfg["msbt_step_ms"] = 250
 
+    def _apply_settings_now(self):
+        self._apply_pending_job = None
+        if self._settings_built:
+            self._read_settings_vars()
+
+        if self.cfg == self._applied_cfg:
+            return
+        self._applied_cfg = dict(self.cfg)
+
         save_cfg(self.cfg)
+        self._rebuild_cfg_snap()
+        # let the worker pick the new settings up now rather than after its current sleep
+        self._wake_evt.set()
 
-        try:
-            self.attributes("-topmost", bool(self.cfg.get("always_on_top", True)))
-        except Exception:
-            pass
+        # -topmost restacks the window; only touch it when the setting flipped
+        topmost = bool(self.cfg.get("always_on_top", True))
+        if topmost != self._last_topmost:
+            try:
+                self.attributes("-topmost", topmost)
+                self._last_topmost = topmost
+            except Exception:
+                pass
 
         try:
-            self.msbt._apply_position()
+            self.msbt._on_cfg_changed()
         except Exception:
             pass
 
-        self._resize_dynamic(allow_shrink=True)
-
     def _msbt_set_pos(self):
         self.msbt.set_position_mode(on_done=self._apply_settings)
 
@@ -1001,11 +1394,10 @@ class App(tk.Tk):
             return
         self.demo_running = True
         self.encounter_active = True
-        self.rotation_start = time.time()
+        self._start_rotation(time.monotonic())
         self.energy_button_shown = False
-        self.last_event_fire.clear()
-        self.last_banner_fire.clear()
         self._hide_energy_button()
+        self._last_pushed.clear()
         self.status.set("RUNNING (DEMO)")
 
     def demo_stop(self):
@@ -1014,9 +1406,8 @@ class App(tk.Tk):
         self.demo_running = False
         self.encounter_active = False
         self.energy_button_shown = False
-        self.last_event_fire.clear()
-        self.last_banner_fire.clear()
         self._hide_energy_button()
+        self._last_pushed.clear()
         self.status.set("WAITING — encounter start")
         self.next_name.set("Next: Red Spore")
         self.countdown.set("00:13")
@@ -1067,9 +1458,76 @@ class App(tk.Tk):
             wdg.bind("<B1-Motion>", self._do_move)
             wdg.bind("<ButtonRelease-1>", self._end_move)
 
-        # Settings panel (hidden by default)
+        # Settings panel (hidden by default); its widgets are built on first open
         self.settings_frame = tk.Frame(self, bg=self.bg)
+        self._settings_built = False
+
+        # Main content
+        tk.Label(
+            self, textvariable=self.status, bg=self.bg, fg=self.fg,
+            font=("Segoe UI", 10, "bold"), anchor="w"
+        ).pack(fill="x", padx=10, pady=(8, 2))
+
+        tk.Label(
+            self, textvariable=self.next_name, bg=self.bg, fg=self.muted,
+            font=("Segoe UI", 9), anchor="w"
+        ).pack(fill="x", padx=10)
 
+        # Timer row with +/- and offset label
+        timer_row = tk.Frame(self, bg=self.bg)
+        timer_row.pack(fill="x", padx=10, pady=(0, 2))
+
+        tk.Button(
+            timer_row, text="−", command=self._offset_minus,
+            bg="#303030", fg=self.fg, relief="flat",
+            width=2, padx=6, pady=6
+        ).pack(side="left")
+
+        tk.Label(
+            timer_row, textvariable=self.countdown, bg=self.bg, fg=self.fg,
+            font=("Consolas", 26, "bold"), anchor="w"
+        ).pack(side="left", padx=8)
+
+        tk.Button(
+            timer_row, text="+", command=self._offset_plus,
+            bg="#303030", fg=self.fg, relief="flat",
+            width=2, padx=6, pady=6
+        ).pack(side="left")
+
+        tk.Label(
+            timer_row, textvariable=self.time_offset_var,
+            bg=self.bg, fg=self.muted, font=("Segoe UI", 9, "bold")
+        ).pack(side="right")
+
+        # Energy button with bright yellow surround (hidden by default)
+        self.energy_border = tk.Frame(self, bg="#ffeb3b")
+        self.resume_btn = tk.Button(
+            self.energy_border,
+            text="MID cleared",
+            command=self.resume_rotation,
+            bg="#303030",
+            fg=self.fg,
+            activebackground="#3a3a3a",
+            activeforeground=self.fg,
+            relief="flat",
+            borderwidth=0,
+            padx=10,
+            pady=8,
+        )
+        self.resume_btn.pack(fill="x", padx=3, pady=3)
+        self.energy_border.pack(fill="x", padx=10, pady=(4, 8))
+        self.energy_border.pack_forget()
+
+        # Integrated banner (hidden until used)
+        self.banner_label = tk.Label(
+            self, text="",
+            bg="#151515", fg=self.fg,
+            font=("Segoe UI", 12, "bold"),
+            padx=12, pady=8, relief="flat",
+        )
+        self.banner_label.place_forget()
+
+    def _build_settings_panel(self):
         self.var_topmost = tk.BooleanVar(value=bool(self.cfg.get("always_on_top", True)))
         self.var_sound = tk.BooleanVar(value=bool(self.cfg.get("event_sound", True)))
         self.var_demo = tk.BooleanVar(value=bool(self.cfg.get("demo_mode", False)))
@@ -1202,71 +1660,7 @@ class App(tk.Tk):
             self.settings_frame, text="Set MSBT position (drag preview)",
             command=self._msbt_set_pos, bg="#303030", fg=self.fg, relief="flat", padx=10, pady=6
         ).pack(anchor="w", pady=(6, 0))
-
-        # Main content
-        tk.Label(
-            self, textvariable=self.status, bg=self.bg, fg=self.fg,
-            font=("Segoe UI", 10, "bold"), anchor="w"
-        ).pack(fill="x", padx=10, pady=(8, 2))
-
-        tk.Label(
-            self, textvariable=self.next_name, bg=self.bg, fg=self.muted,
-            font=("Segoe UI", 9), anchor="w"
-        ).pack(fill="x", padx=10)
-
-        # Timer row with +/- and offset label
-        timer_row = tk.Frame(self, bg=self.bg)
-        timer_row.pack(fill="x", padx=10, pady=(0, 2))
-
-        tk.Button(
-            timer_row, text="−", command=self._offset_minus,
-            bg="#303030", fg=self.fg, relief="flat",
-            width=2, padx=6, pady=6
-        ).pack(side="left")
-
-        tk.Label(
-            timer_row, textvariable=self.countdown, bg=self.bg, fg=self.fg,
-            font=("Consolas", 26, "bold"), anchor="w"
-        ).pack(side="left", padx=8)
-
-        tk.Button(
-            timer_row, text="+", command=self._offset_plus,
-            bg="#303030", fg=self.fg, relief="flat",
-            width=2, padx=6, pady=6
-        ).pack(side="left")
-
-        tk.Label(
-            timer_row, textvariable=self.time_offset_var,
-            bg=self.bg, fg=self.muted, font=("Segoe UI", 9, "bold")
-        ).pack(side="right")
-
-        # Energy button with bright yellow surround (hidden by default)
-        self.energy_border = tk.Frame(self, bg="#ffeb3b")
-        self.resume_btn = tk.Button(
-            self.energy_border,
-            text="MID cleared",
-            command=self.resume_rotation,
-            bg="#303030",
-            fg=self.fg,
-            activebackground="#3a3a3a",
-            activeforeground=self.fg,
-            relief="flat",
-            borderwidth=0,
-            padx=10,
-            pady=8,
-        )
-        self.resume_btn.pack(fill="x", padx=3, pady=3)
-        self.energy_border.pack(fill="x", padx=10, pady=(4, 8))
-        self.energy_border.pack_forget()
-
-        # Integrated banner (hidden until used)
-        self.banner_label = tk.Label(
-            self, text="",
-            bg="#151515", fg=self.fg,
-            font=("Segoe UI", 12, "bold"),
-            padx=12, pady=8, relief="flat",
-        )
-        self.banner_label.place_forget()
+        self._settings_built = True
 
     # -------------------- monitoring --------------------
 
@@ -1277,127 +1671,267 @@ class App(tk.Tk):
             self._show_first_run_instructions()
             return
         self.running = True
-        self.worker = threading.Thread(target=self._loop, daemon=True)
+        # fresh event per worker, so a worker that is still finishing its last
+        # tick after a stop can't be revived by the next start
+        self._stop_evt = threading.Event()
+        self.worker = threading.Thread(target=self._loop, args=(self._stop_evt,), daemon=True)
         self.worker.start()
 
-    def _loop(self):
-        poll_s = float(self.cfg.get("poll_ms", 120)) / 1000.0
+    def _stop_monitoring(self):
+        self.running = False
+        self._stop_evt.set()
+        self._wake_evt.set()
+
+    def _sleep(self, stop_evt: threading.Event, seconds: float) -> bool:
+        """Worker sleep; returns True when the worker should exit."""
+        self._wake_evt.wait(seconds)
+        self._wake_evt.clear()
+        return stop_evt.is_set()
+
+    def _push(self, name: str, value: str):
+        """Set StringVar `name` from the worker; no Tk round-trip when the text hasn't changed."""
+        if self._last_pushed.get(name) == value:
+            return
+        self._last_pushed[name] = value
+        with self._ui_lock:
+            schedule = not self._pending_ui
+            self._pending_ui[name] = value
+        # one Tk callback per batch: later pushes before the flush just join it
+        if schedule:
+            self.after(0, self._flush_ui)
+
+    def _flush_ui(self):
+        with self._ui_lock:
+            pending, self._pending_ui = self._pending_ui, {}
+        for name, value in pending.items():
+            getattr(self, name).set(value)
+
+    def _loop(self, stop_evt: threading.Event):
+        # size 1: the scorer only ever wants the newest (grab time, gray) pair
+        grab_q = queue.Queue(maxsize=1)
+        # gray buffers the scorer is done with, reused by the pump for later grabs
+        free_q = queue.Queue()
+        self._poll_delay_s = self._cfg_snap.poll_s
+        threading.Thread(target=self._grab_pump, args=(stop_evt, grab_q, free_q), daemon=True).start()
+        self._run_loop(stop_evt, grab_q, free_q)
+
+    def _grab_pump(self, stop_evt: threading.Event, grab_q: queue.Queue, free_q: queue.Queue):
+        """
+        Capture thread: grabs the timer region while the monitoring thread
+        scores the previous grab, so a tick costs max(grab, score) rather
+        than grab + score.
+        """
+        def drop_queued():
+            try:
+                _, stale = grab_q.get_nowait()  # a grab the scorer never got to
+            except queue.Empty:
+                return
+            if stale is not None:
+                free_q.put_nowait(stale)
+
+        try:
+            while not stop_evt.is_set():
+                if self._cfg_snap.demo_mode:
+                    # the scorer ignores the queue in demo mode: don't leave an old
+                    # grab there to be read as "now" once demo mode is switched off
+                    drop_queued()
+                    if self._sleep(stop_evt, 0.10):
+                        return
+                    continue
+
+                t0 = time.monotonic()
+                try:
+                    gray = self._grab_gray()
+                except Exception as e:
+                    # locked workstation, secure desktop, display change: retry shortly
+                    self._report_error("capture", e)
+                    if self._sleep(stop_evt, 0.5):
+                        return
+                    continue
+                self._clear_error("capture")
+                buf = None
+                if gray is not None:
+                    # copy out of the capture buffer (the next grab reuses it) into a
+                    # buffer handed back by the scorer; only allocate on startup or
+                    # after the region changed size
+                    try:
+                        buf = free_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    if buf is None or buf.shape != gray.shape:
+                        buf = np.empty_like(gray)
+                    np.copyto(buf, gray)
+                drop_queued()
+                grab_q.put_nowait((t0, buf))
+
+                # no slower rate while the window is minimized: alerts still fire then,
+                # and a late encounter start would shift every alert in the rotation
+                delay_s = 0.2 if gray is None else self._poll_delay_s
+                if self._sleep(stop_evt, max(0.02, delay_s - (time.monotonic() - t0))):
+                    return
+        finally:
+            self._close_mss()
+            try:
+                grab_q.put_nowait((time.monotonic(), None))  # unblock the scorer
+            except queue.Full:
+                pass
+
+    def _report_error(self, where: str, e: Exception):
+        """A failure that repeats every tick gets printed once, then counted."""
+        sig = (type(e).__name__, str(e))
+        if sig == self._last_exc_sig.get(where):
+            self._exc_count[where] += 1
+            return
+        self._flush_exc_repeats(where)
+        self._last_exc_sig[where] = sig
+        print(f"SusAlert {where} error:\n" + traceback.format_exc())
+
+    def _clear_error(self, where: str):
+        if self._last_exc_sig.get(where) is not None:
+            self._flush_exc_repeats(where)
+            self._last_exc_sig[where] = None
+
+    def _flush_exc_repeats(self, where: str):
+        n = self._exc_count.get(where, 0)
+        if n:
+            print(f"SusAlert {where} error: (repeated {n} times)")
+        self._exc_count[where] = 0
+
+    def _run_loop(self, stop_evt: threading.Event, grab_q: queue.Queue, free_q: queue.Queue):
         miss_reset_s = 4.0
-        cooldown_s = float(self.cfg.get("cooldown_s", 1.0))
-        tolerance = max(0.06, poll_s * 1.2)
+        # interval used on the previous tick
+        delay_s = self._cfg_snap.poll_s
 
-        self.after(0, lambda: self.status.set(
-            "WAITING (DEMO) — press Start Demo" if self.cfg.get("demo_mode", False) else "WAITING — encounter start"
-        ))
-        self.after(0, lambda: self.next_name.set("Next: Red Spore"))
-        self.after(0, lambda: self.countdown.set("00:13"))
+        self._last_pushed.clear()
+        self._push("status", self._cfg_snap.status_waiting)
+        self._push("next_name", "Next: Red Spore")
+        self._push("countdown", "00:13")
 
-        last_demo_hint = 0.0
+        last_demo_hint = float("-inf")
 
-        while self.running:
-            t0 = time.time()
+        while not stop_evt.is_set():
+            t0 = time.monotonic()
             now = t0
+            snap = self._cfg_snap
+            # a due event found later than this (worker stalled, PC resumed from sleep)
+            # is marked done without alerting; never less than one tick interval
+            stale_s = max(1.0, delay_s * 1.2)
+            # no encounter: keep watching at poll_ms, since a late start detection
+            # shifts every alert in the rotation by a random amount
+            delay_s = snap.poll_s
 
             try:
-                if bool(self.cfg.get("demo_mode", False)):
+                if snap.demo_mode:
                     if not self.demo_running:
                         if now - last_demo_hint > 2.5:
                             last_demo_hint = now
-                            self.after(0, lambda: self.status.set("WAITING (DEMO) — press Start Demo"))
-                        time.sleep(0.10)
+                            self._push("status", snap.status_waiting)
+                        if self._sleep(stop_evt, 0.10):
+                            return
                         continue
                     present = True
                 else:
-                    gray = self._grab_gray()
+                    try:
+                        grabbed_at, gray = grab_q.get(timeout=1.0)
+                    except queue.Empty:
+                        continue
                     if gray is None:
-                        time.sleep(0.2)
                         continue
-                    score = self.matcher.score(gray)
-                    present = score >= float(self.cfg.get("template_threshold", 0.62))
+                    # time the frame was taken, not when scoring got to it
+                    now = grabbed_at
+                    try:
+                        score = self.matcher.score(gray)
+                    finally:
+                        free_q.put_nowait(gray)  # back to the grab pump
+                    present = score >= self.matcher.threshold
 
                 if present:
                     self.last_seen_timer = now
                     if not self.encounter_active:
                         self.encounter_active = True
-                        self.rotation_start = now
+                        self._start_rotation(now)
                         self.energy_button_shown = False
-                        self.last_event_fire.clear()
-                        self.last_banner_fire.clear()
                         self.after(0, self._hide_energy_button)
-                        self.after(0, lambda: self.status.set("RUNNING" + (" (DEMO)" if self.cfg.get("demo_mode", False) else "")))
+                        self._push("status", snap.status_running)
                 else:
                     if self.encounter_active and (now - self.last_seen_timer) >= miss_reset_s:
                         self.encounter_active = False
                         self.energy_button_shown = False
-                        self.last_event_fire.clear()
-                        self.last_banner_fire.clear()
                         self.after(0, self._hide_energy_button)
-                        self.after(0, lambda: self.status.set("WAITING — encounter start"))
-                        self.after(0, lambda: self.next_name.set("Next: Red Spore"))
-                        self.after(0, lambda: self.countdown.set("00:13"))
+                        self._push("status", snap.status_waiting)
+                        self._push("next_name", "Next: Red Spore")
+                        self._push("countdown", "00:13")
                         self.after(0, self._banner_hide_now)
                         self.after(0, self.msbt.hide)
 
                 if self.encounter_active:
                     rot_t = max(0.0, self._effective_elapsed())
-                    nxt_sec, nxt_name = self._next_event(rot_t)
-                    remaining = int(round(nxt_sec - rot_t))
-
-                    self.after(0, lambda n=nxt_name: self.next_name.set(f"Next: {n}"))
-                    self.after(0, lambda r=remaining: self.countdown.set(self._fmt_mmss(r)))
-                    self.after(0, lambda: self.status.set("RUNNING" + (" (DEMO)" if self.cfg.get("demo_mode", False) else "")))
-
-                    # Banner countdown triggers
-                    if bool(self.cfg.get("banner_enabled", False)) and str(self.cfg.get("banner_mode", "COUNTDOWN")) == "COUNTDOWN":
-                        cd_s = int(self.cfg.get("banner_countdown_s", 3))
-                        for sec, name in ROTATION_EVENTS:
-                            trigger_t = sec - cd_s
-                            if trigger_t >= 0 and abs(rot_t - trigger_t) < tolerance:
-                                key = f"bcd:{sec}:{name}"
-                                if now - self.last_banner_fire.get(key, 0.0) >= max(0.8, cooldown_s):
-                                    self.last_banner_fire[key] = now
-                                    self.after(0, lambda nm=name, s=cd_s: self._banner_countdown(nm, s))
-
-                    # MSBT countdown triggers
-                    if bool(self.cfg.get("msbt_enabled", True)) and str(self.cfg.get("banner_mode", "COUNTDOWN")) == "COUNTDOWN":
-                        cd_s = int(self.cfg.get("banner_countdown_s", 3))
-                        for sec, name in ROTATION_EVENTS:
-                            trigger_t = sec - cd_s
-                            if trigger_t >= 0 and abs(rot_t - trigger_t) < tolerance:
-                                key = f"mcd:{sec}:{name}"
-                                if now - self.last_banner_fire.get(key, 0.0) >= max(0.8, cooldown_s):
-                                    self.last_banner_fire[key] = now
-                                    self.after(0, lambda nm=name, s=cd_s: self.msbt.show_countdown(nm, s))
-
-                    # Exact-time triggers
-                    for sec, name in ROTATION_EVENTS:
-                        if abs(rot_t - sec) < tolerance:
-                            key = f"{sec}:{name}"
-                            if now - self.last_event_fire.get(key, 0.0) >= cooldown_s:
-                                self.last_event_fire[key] = now
-
-                                if bool(self.cfg.get("event_sound", True)):
-                                    self.after(0, lambda: play_alert_sound(self))
-
-                                # Banner NOW (if mode NOW)
-                                if bool(self.cfg.get("banner_enabled", False)) and str(self.cfg.get("banner_mode", "COUNTDOWN")) == "NOW":
-                                    hold = int(self.cfg.get("banner_hold_ms", 1200))
-                                    self.after(0, lambda nm=name, h=hold: self._show_banner_text(f"{nm} NOW!", h))
-
-                                # MSBT NOW (if mode NOW)
-                                if bool(self.cfg.get("msbt_enabled", True)) and str(self.cfg.get("banner_mode", "COUNTDOWN")) == "NOW":
-                                    dur = int(self.cfg.get("msbt_duration_ms", 2500))
-                                    self.after(0, lambda nm=name, d=dur: self.msbt.show_text(f"{nm} NOW!", d))
-
-                                if sec == ENERGY_TIME and not self.energy_button_shown:
-                                    self.energy_button_shown = True
-                                    self.after(0, self._show_energy_button)
-
-            except Exception:
-                print("SusAlert loop error:\n" + traceback.format_exc())
-
-            dt = time.time() - t0
-            time.sleep(max(0.02, poll_s - dt))
+                    nxt_i = self._next_event(rot_t)
+                    nxt_name = ROTATION_NAMES[nxt_i]
+                    until_next = float(self._event_firetimes[nxt_i]) - now
+                    remaining = int(round(until_next))
+
+                    # poll faster only while a mechanic or its countdown trigger is close
+                    near_window_s = max(5.0, snap.banner_cd_s + 1.0)
+                    delay_s = snap.near_s if until_next < near_window_s else snap.poll_s
+
+                    self._push("next_name", f"Next: {nxt_name}")
+                    self._push("countdown", self._fmt_mmss(remaining))
+                    self._push("status", snap.status_running)
+
+                    # Countdown triggers (banner + MSBT): each event's countdown fires once,
+                    # cd_s before the event, same deadline scheme as the exact triggers below
+                    if snap.banner_mode == "COUNTDOWN" and (snap.banner_enabled or snap.msbt_enabled):
+                        cd_s = snap.banner_cd_s
+                        cd_fired = self._cd_fired
+                        cd_times = self._event_firetimes - cd_s
+                        for i in np.flatnonzero(~cd_fired & (now >= cd_times)):
+                            cd_fired[i] = True
+                            if ROTATION_SECS[i] < cd_s or now - cd_times[i] > stale_s:
+                                continue
+                            name = ROTATION_NAMES[i]
+                            if snap.banner_enabled:
+                                self.after(0, self._banner_countdown, name, cd_s)
+                            if snap.msbt_enabled:
+                                self.after(0, self.msbt.show_countdown, name, cd_s)
+
+                    # Exact-time triggers: every due event that hasn't fired yet
+                    fired = self._fired
+                    for i in np.flatnonzero(~fired & (now >= self._event_firetimes)):
+                        fired[i] = True
+                        sec = int(ROTATION_SECS[i])
+
+                        if sec == ENERGY_TIME and not self.energy_button_shown:
+                            self.energy_button_shown = True
+                            self.after(0, self._show_energy_button)
+
+                        if now - self._event_firetimes[i] > stale_s:
+                            continue
+
+                        if snap.event_sound:
+                            self.after(0, play_alert_sound, self)
+
+                        now_text = ROTATION_NOW_TEXTS[i]
+
+                        # Banner NOW (if mode NOW)
+                        if snap.banner_enabled and snap.banner_mode == "NOW":
+                            self.after(0, self._show_banner_text, now_text, snap.banner_hold_ms)
+
+                        # MSBT NOW (if mode NOW)
+                        if snap.msbt_enabled and snap.banner_mode == "NOW":
+                            self.after(0, self.msbt.show_text, now_text, snap.msbt_duration_ms)
+
+            except Exception as e:
+                self._report_error("loop", e)
+            else:
+                self._clear_error("loop")
+
+            self._poll_delay_s = delay_s
+            if snap.demo_mode:
+                dt = time.monotonic() - t0
+                if self._sleep(stop_evt, max(0.02, delay_s - dt)):
+                    return
+            # otherwise the grab pump paces the loop: the next get() waits for its next grab
 
 
 def main():